@@ -1,8 +1,13 @@
 import os
+import logging
 from pydub import AudioSegment
 from typing import List, Optional, Set
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 class AudioHandler:
     def __init__(self, config):
         self.config = config
@@ -13,47 +18,69 @@ class AudioHandler:
         if os.path.isfile(path):
             return [path] if self.config.is_supported_format(path) else []
         
+        # Depth-first over a stack rather than recursion, so deep trees can't hit the recursion limit
         media_files = []
-        for root, _, files in os.walk(path):
-            for file in files:
-                if self.config.is_supported_format(file):
-                    media_files.append(os.path.join(root, file))
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            # Like os.walk, don't descend into symlinked directories
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif self.config.is_supported_format(entry.name):
+                            media_files.append(entry.path)
+            except OSError as e:
+                logger.warning("Could not scan directory %s: %s", current, e)
+                continue
+            
+            # Reversed so directories are visited in listing order, matching os.walk
+            pending.extend(reversed(subdirs))
         return media_files
     
     def prepare_audio(self, file_path: str) -> Optional[str]:
         """Prepare audio from an audio or video file for transcription"""
         try:
-            file_ext = Path(file_path).suffix.lower()
-            is_video = file_ext in self.config.supported_video_formats
             file_size = os.path.getsize(file_path)
             
-            print(f"DEBUG: Preparing file: {file_path} (format: {file_ext}, size: {file_size} bytes, is_video: {is_video})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Preparing file: %s (format: %s, size: %s, is_video: %s)",
+                             file_path, Path(file_path).suffix.lower(), self.format_file_size(file_size),
+                             self.config.is_video_format(file_path))
             
             if file_size == 0:
-                print(f"ERROR: File is empty: {file_path}")
+                logger.error("File is empty: %s", file_path)
                 return None
             
             # Load file using pydub - it handles audio and video files
-            print(f"DEBUG: Loading file with pydub...")
+            logger.debug("Loading file with pydub...")
             try:
                 audio = AudioSegment.from_file(file_path)
-                print(f"DEBUG: File loaded successfully - duration: {len(audio)}ms, channels: {audio.channels}, sample rate: {audio.frame_rate}")
+                logger.debug("File loaded successfully - duration: %dms, channels: %s, sample rate: %s",
+                             len(audio), audio.channels, audio.frame_rate)
             except Exception as e:
-                print(f"ERROR: Failed to load file with pydub: {e}")
+                logger.error("Failed to load file with pydub: %s", e)
                 return None
             
             if len(audio) == 0:
-                print(f"ERROR: Audio stream has zero duration: {file_path}")
+                logger.error("Audio stream has zero duration: %s", file_path)
                 return None
             elif len(audio) < 1000:
-                print(f"WARNING: Audio stream is very short ({len(audio)}ms): {file_path}")
+                logger.warning("Audio stream is very short (%dms): %s", len(audio), file_path)
 
             # Always convert to a standard WAV format for transcription
             temp_path = os.path.join(
                 os.path.dirname(file_path),
                 f"temp_{os.path.basename(file_path)}.wav"
             )
-            print(f"DEBUG: Converting to WAV format: {temp_path}")
+            logger.debug("Converting to WAV format: %s", temp_path)
             
             # Export with standard settings
             audio.export(
@@ -63,31 +90,42 @@ class AudioHandler:
             )
             
             if os.path.exists(temp_path) and os.path.getsize(temp_path) > 0:
-                print(f"DEBUG: WAV file exported successfully (size: {os.path.getsize(temp_path)} bytes)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("WAV file exported successfully (size: %s)",
+                                 self.format_file_size(os.path.getsize(temp_path)))
                 self.temp_files.add(temp_path)
                 return temp_path
             else:
-                print(f"ERROR: Failed to create or exported WAV file is empty: {temp_path}")
+                logger.error("Failed to create or exported WAV file is empty: %s", temp_path)
                 return None
             
         except Exception as e:
-            print(f"ERROR: Error preparing file {file_path}: {str(e)}")
-            print(f"DEBUG: Make sure you have ffmpeg installed for full format support.")
+            logger.error("Error preparing file %s: %s", file_path, e)
+            logger.debug("Make sure you have ffmpeg installed for full format support.")
             return None
     
+    @staticmethod
+    def format_file_size(size_bytes: int) -> str:
+        """Format a byte count as a human-readable size string"""
+        if size_bytes < 1024:
+            return f"{size_bytes} B"
+        # Each unit step is 10 bits, so the bit length selects the unit without a division loop
+        idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+    
     def cleanup_temp_file(self, file_path: str):
         """Clean up temporary WAV file if it exists"""
         if file_path in self.temp_files:
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
-                    print(f"DEBUG: Cleaned up temporary file: {file_path}")
+                    logger.debug("Cleaned up temporary file: %s", file_path)
                 self.temp_files.remove(file_path)
             except Exception as e:
-                print(f"ERROR: Error cleaning up temporary file {file_path}: {str(e)}")
+                logger.error("Error cleaning up temporary file %s: %s", file_path, e)
     
     def cleanup_all_temp_files(self):
         """Clean up all temporary files that were created"""
-        print(f"DEBUG: Cleaning up {len(self.temp_files)} temporary files")
+        logger.debug("Cleaning up %d temporary files", len(self.temp_files))
         for temp_file in list(self.temp_files):  # Create a copy of the set to iterate
             self.cleanup_temp_file(temp_file) 
\ No newline at end of file
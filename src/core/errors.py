@@ -20,4 +20,8 @@ class TranscriptionError(RecallError):
 
 class SilentAudioError(TranscriptionError):
     """Raised specifically when an audio file is silent or contains no detectable speech."""
-    pass 
\ No newline at end of file
+    pass
+
+class TranscriptionCancelledError(TranscriptionError):
+    """Raised when a transcription is abandoned because the user cancelled the run."""
+    pass
@@ -0,0 +1,60 @@
+"""
+Bounded, priority-ordered execution of transcription jobs.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+
+from src.core.errors import RecallError
+
+logger = logging.getLogger(__name__)
+
+class TranscriptionQueue:
+    """Runs submitted jobs on a fixed pool of worker threads, lowest priority value first."""
+    def __init__(self, handler, max_concurrent=1, maxsize=10000):
+        self._handler = handler
+        self.max_concurrent = max(1, max_concurrent)
+        self._queue = queue.PriorityQueue(maxsize)
+        self._counter = itertools.count()  # Keeps FIFO order within the same priority
+        self._workers = []
+        self._lock = threading.Lock()
+        
+    def submit(self, job_id, priority=0):
+        """Queue a job for processing. Raises RecallError if the queue is full."""
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((priority, next(self._counter), job_id))
+        except queue.Full:
+            raise RecallError("Too many transcription jobs queued. Please try again later.")
+    
+    def pending(self):
+        """Return the approximate number of jobs waiting for a worker."""
+        return self._queue.qsize()
+    
+    def join(self):
+        """Block until every submitted job has been processed."""
+        self._queue.join()
+        
+    def _ensure_workers(self):
+        """Start worker threads on first use."""
+        with self._lock:
+            while len(self._workers) < self.max_concurrent:
+                worker = threading.Thread(
+                    target=self._run,
+                    name=f"transcription-worker-{len(self._workers)}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+    
+    def _run(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            try:
+                self._handler(job_id)
+            except Exception:
+                logger.exception("Unhandled error while processing job %s", job_id)
+            finally:
+                self._queue.task_done()
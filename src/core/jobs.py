@@ -10,6 +10,10 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 
 class TranscriptionJob:
     """Represents a single transcription job, which can contain multiple files."""
+    # Jobs are updated on every progress callback; slots keep attribute access and per-job memory small
+    __slots__ = ('job_id', 'files', 'output_directory', 'same_as_input', 'export_timestamps',
+                 'status', 'progress', 'current_file', 'results', 'error', 'start_time', 'end_time')
+    
     def __init__(self, job_id, files, output_directory=None, same_as_input=False, export_timestamps=False):
         self.job_id = job_id
         self.files = files
@@ -23,6 +27,10 @@ class TranscriptionJob:
         self.error = None
         self.start_time = None
         self.end_time = None
+    
+    def update_progress(self, progress):
+        """Set overall progress as a percentage, clamped to 0-100."""
+        self.progress = min(max(progress, 0), 100)
         
     def to_dict(self):
         """Serializes the job object to a dictionary."""
@@ -2,11 +2,26 @@ import os
 from pathlib import Path
 import time
 import json
-from typing import Callable, Optional
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
 from datetime import datetime
-import assemblyai as aai
 import certifi
 
+from src.core.errors import TranscriptionCancelledError
+from src.utils.files import write_text_file
+
+# The AssemblyAI SDK takes a few hundred ms to import, so it is loaded on first use through _aai()
+if TYPE_CHECKING:
+    import assemblyai as aai
+
+logger = logging.getLogger(__name__)
+
+def _aai():
+    """Return the AssemblyAI SDK module, importing it on first call"""
+    import assemblyai
+    return assemblyai
+
 class TranscriptionMetrics:
     def __init__(self, file_path: str, file_size_mb: float):
         self.file_path = file_path
@@ -32,6 +47,56 @@ class TranscriptionMetrics:
             f"Speed: {self.mb_per_second:.2f} MB/s"
         )
 
+class RateLimiter:
+    """Thread-safe token bucket allowing at most max_rate acquisitions per time_period seconds"""
+    def __init__(self, max_rate: int, time_period: float):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def acquire(self, tokens: int = 1):
+        """Block until tokens are available, then consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * self._refill_rate)
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self._refill_rate
+            time.sleep(wait)
+            
+    def __enter__(self):
+        self.acquire()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+# AssemblyAI allows 20,000 requests per 5 minutes; pace at ~95% of that across all transcribers
+_ASSEMBLYAI_LIMITER = RateLimiter(max_rate=19000, time_period=300)
+
+# Caps simultaneous AssemblyAI transcriptions across every Transcriber in the process;
+# created on first use because the limit comes from Config
+_REQUEST_SLOTS = None
+_REQUEST_SLOTS_LOCK = threading.Lock()
+
+def _assemblyai_request_slots(max_concurrency: int) -> threading.BoundedSemaphore:
+    """Return the process-wide AssemblyAI request semaphore, creating it on first use"""
+    global _REQUEST_SLOTS
+    with _REQUEST_SLOTS_LOCK:
+        if _REQUEST_SLOTS is None:
+            _REQUEST_SLOTS = threading.BoundedSemaphore(max(1, max_concurrency))
+        return _REQUEST_SLOTS
+
+# AssemblyAI transcriber clients keyed by API key, shared by every Transcriber in the process
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 class Transcriber:
     def __init__(self, config):
         self.config = config
@@ -41,34 +106,76 @@ class Transcriber:
         os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
         os.environ['CURL_CA_BUNDLE'] = certifi.where()
         
-        # Debug: Print API key status
+        # Debug: Log API key status
         if config.api_key:
-            print(f"DEBUG: API key configured (length: {len(config.api_key)})")
-            print(f"DEBUG: API key starts with: {config.api_key[:10]}...")
+            logger.debug("API key configured (length: %d)", len(config.api_key))
         else:
-            print("DEBUG: No API key configured!")
+            logger.debug("No API key configured!")
         
         # Initialize AssemblyAI client with API key (if available)
         if config.api_key:
+            aai = _aai()
             aai.settings.api_key = config.api_key
-            
-            # Create transcriber with nano model and speaker labels
-            transcriber_config = aai.TranscriptionConfig(
-                speaker_labels=True,
-                speech_model=aai.SpeechModel.nano
-            )
-            self.transcriber = aai.Transcriber(config=transcriber_config)
+            self.transcriber = self._get_client(config.api_key)
         else:
             self.transcriber = None
 
         self.metrics = []
         self.last_transcript = None  # Store last transcript object for data export
         
-    def transcribe_file(self, audio_path: str, progress_callback: Callable[[str, float, str, dict], None] = None) -> str:
-        """Simple audio file transcription with detailed progress updates"""
+        # Cap the number of simultaneous AssemblyAI requests across all transcribers
+        self._request_slots = _assemblyai_request_slots(config.assemblyai_max_concurrency)
+        
+        # AssemblyAI labels speakers 'A', 'B', ...; preseed so the common case is a dict hit
+        self._speaker_label_cache = {chr(c): f"Speaker {chr(c)}" for c in range(ord('A'), ord('Z') + 1)}
+        
+    @staticmethod
+    def _get_client(api_key: str):
+        """Return the shared AssemblyAI transcriber for an API key, creating it on first use"""
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(api_key)
+            if client is None:
+                aai = _aai()
+                # Create transcriber with nano model and speaker labels
+                transcriber_config = aai.TranscriptionConfig(
+                    speaker_labels=True,
+                    speech_model=aai.SpeechModel.nano
+                )
+                client = _CLIENT_CACHE[api_key] = aai.Transcriber(config=transcriber_config)
+            return client
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop all cached AssemblyAI clients, e.g. after the API key changes"""
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE.clear()
+        
+    def _transcribe_cancellable(self, audio_path: str, cancel_event: threading.Event):
+        """Submit a file and poll for its result, giving up between polls once cancel_event is set"""
+        aai = _aai()
+        if cancel_event.is_set():
+            raise TranscriptionCancelledError("Transcription cancelled")
+        
+        # submit uploads the file and then creates the transcript: two requests
+        _ASSEMBLYAI_LIMITER.acquire(2)
+        transcript = self.transcriber.submit(audio_path)
+        while transcript.status not in (aai.TranscriptStatus.completed, aai.TranscriptStatus.error):
+            if cancel_event.wait(aai.settings.polling_interval):
+                raise TranscriptionCancelledError("Transcription cancelled")
+            _ASSEMBLYAI_LIMITER.acquire()
+            transcript = aai.Transcript.get_by_id(transcript.id)
+        return transcript
+        
+    def transcribe_file(self, audio_path: str, progress_callback: Callable[[str, float, str, dict], None] = None,
+                        cancel_event: Optional[threading.Event] = None) -> str:
+        """Simple audio file transcription with detailed progress updates.
+        
+        If cancel_event is given, it is checked while waiting on AssemblyAI and a
+        TranscriptionCancelledError is raised as soon as it is set.
+        """
         if not self.transcriber:
             error_msg = "No API key configured. Please set your AssemblyAI API key in Settings > API Key."
-            print(f"ERROR: {error_msg}")
+            logger.error(error_msg)
             if progress_callback:
                 progress_callback(error_msg, -1, "error")
             raise Exception(error_msg)
@@ -78,7 +185,7 @@ class Transcriber:
             audio_path = Path(audio_path)
             file_size = audio_path.stat().st_size / (1024 * 1024)  # Size in MB
             
-            print(f"DEBUG: Starting transcription for {audio_path.name} (size: {file_size:.1f} MB)")
+            logger.debug("Starting transcription for %s (size: %.1f MB)", audio_path.name, file_size)
             
             # Create metrics tracker
             metrics = TranscriptionMetrics(str(audio_path), file_size)
@@ -102,19 +209,25 @@ class Transcriber:
                     {"metrics": str(metrics)}
                 )
             
-            print(f"DEBUG: Calling AssemblyAI API for {audio_path.name}")
+            logger.debug("Calling AssemblyAI API for %s", audio_path.name)
             
-            # Use AssemblyAI to transcribe
-            transcript = self.transcriber.transcribe(str(audio_path))
+            # Use AssemblyAI to transcribe; each request is paced by the shared rate limiter
+            with self._request_slots:
+                if cancel_event is None:
+                    # The SDK polls internally here, so only the upload and submit are paced
+                    _ASSEMBLYAI_LIMITER.acquire(2)
+                    transcript = self.transcriber.transcribe(str(audio_path))
+                else:
+                    transcript = self._transcribe_cancellable(str(audio_path), cancel_event)
 
             # Store transcript object for later use (JSON/SRT export)
             self.last_transcript = transcript
 
-            print(f"DEBUG: API response status: {transcript.status}")
+            logger.debug("API response status: %s", transcript.status)
             
-            if transcript.status == aai.TranscriptStatus.error:
+            if transcript.status == _aai().TranscriptStatus.error:
                 error_msg = f"Transcription failed: {transcript.error}"
-                print(f"ERROR: {error_msg}")
+                logger.error(error_msg)
                 raise Exception(error_msg)
                 
             # Complete metrics
@@ -128,38 +241,39 @@ class Transcriber:
                     {"metrics": str(metrics)}
                 )
             
-            # Debug: Print transcript information
-            print(f"DEBUG: Transcript has utterances: {hasattr(transcript, 'utterances') and transcript.utterances}")
-            print(f"DEBUG: Transcript has text: {hasattr(transcript, 'text') and transcript.text}")
-            
-            # Additional debugging - inspect the transcript object
-            print(f"DEBUG: Transcript.text value: '{transcript.text}'")
-            if hasattr(transcript, 'utterances'):
-                print(f"DEBUG: Transcript.utterances value: {transcript.utterances}")
-            if hasattr(transcript, 'words'):
-                print(f"DEBUG: Transcript.words: {len(transcript.words) if transcript.words else 0} words")
-            if hasattr(transcript, 'confidence'):
-                print(f"DEBUG: Transcript.confidence: {transcript.confidence}")
-            if hasattr(transcript, 'audio_duration'):
-                print(f"DEBUG: Transcript.audio_duration: {transcript.audio_duration} seconds")
-            
-            # Check if transcript has any content at all
-            transcript_dict = transcript.json_response if hasattr(transcript, 'json_response') else None
-            if transcript_dict:
-                print(f"DEBUG: Full transcript JSON keys: {list(transcript_dict.keys())}")
+            # Debug: Inspect the transcript object (skipped entirely unless DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Transcript has utterances: %s", hasattr(transcript, 'utterances') and transcript.utterances)
+                logger.debug("Transcript has text: %s", hasattr(transcript, 'text') and transcript.text)
+                logger.debug("Transcript.text value: '%s'", transcript.text)
+                if hasattr(transcript, 'utterances'):
+                    logger.debug("Transcript.utterances value: %s", transcript.utterances)
+                if hasattr(transcript, 'words'):
+                    logger.debug("Transcript.words: %d words", len(transcript.words) if transcript.words else 0)
+                if hasattr(transcript, 'confidence'):
+                    logger.debug("Transcript.confidence: %s", transcript.confidence)
+                if hasattr(transcript, 'audio_duration'):
+                    logger.debug("Transcript.audio_duration: %s seconds", transcript.audio_duration)
+                
+                # Check if transcript has any content at all
+                transcript_dict = transcript.json_response if hasattr(transcript, 'json_response') else None
+                if transcript_dict:
+                    logger.debug("Full transcript JSON keys: %s", list(transcript_dict.keys()))
             
             # Build full transcript with speaker labels
             full_transcript = ""
             
             # Check if transcript has utterances (speaker diarization)
             if hasattr(transcript, 'utterances') and transcript.utterances:
-                print(f"DEBUG: Found {len(transcript.utterances)} utterances")
+                logger.debug("Found %d utterances", len(transcript.utterances))
+                lines = []
                 for i, utterance in enumerate(transcript.utterances):
-                    print(f"DEBUG: Utterance {i}: Speaker {utterance.speaker}, Text: {utterance.text[:50]}...")
-                    full_transcript += f"Speaker {utterance.speaker}: {utterance.text}\n"
+                    logger.debug("Utterance %d: Speaker %s, Text: %s...", i, utterance.speaker, utterance.text[:50])
+                    lines.append(f"{self.map_speaker_label(utterance.speaker)}: {utterance.text}\n")
+                full_transcript = "".join(lines)
             elif hasattr(transcript, 'text') and transcript.text:
                 # Fall back to basic transcript text if no speaker diarization
-                print(f"DEBUG: Using basic transcript text (length: {len(transcript.text)})")
+                logger.debug("Using basic transcript text (length: %d)", len(transcript.text))
                 full_transcript = transcript.text
             else:
                 # Check if this is actually a silent audio file
@@ -167,7 +281,7 @@ class Transcriber:
                     hasattr(transcript, 'confidence') and transcript.confidence == 0.0 and
                     hasattr(transcript, 'words') and len(transcript.words) == 0):
                     
-                    print("DEBUG: Audio file appears to be silent or contain no speech")
+                    logger.debug("Audio file appears to be silent or contain no speech")
                     error_msg = (
                         f"Audio file '{audio_path.name}' appears to be silent or contain no detectable speech. "
                         f"Duration: {transcript.audio_duration} seconds, but no words were transcribed. "
@@ -177,20 +291,30 @@ class Transcriber:
                         progress_callback(error_msg, -1, "error", {"metrics": str(metrics)})
                     return ""
                 else:
-                    print("DEBUG: No text found in transcript response")
+                    logger.debug("No text found in transcript response")
                     full_transcript = ""
             
-            print(f"DEBUG: Final transcript length: {len(full_transcript)}")
+            logger.debug("Final transcript length: %d", len(full_transcript))
             
             return full_transcript
             
+        except TranscriptionCancelledError:
+            logger.info("Transcription of %s cancelled", audio_path)
+            raise
         except Exception as e:
             error_msg = f"Failed to transcribe {audio_path}: {str(e)}"
-            print(f"ERROR: {error_msg}")
+            logger.error(error_msg)
             if progress_callback:
                 progress_callback(error_msg, -1, "error", {"metrics": str(metrics) if 'metrics' in locals() else ""})
             return ""
     
+    def map_speaker_label(self, speaker) -> str:
+        """Return the display label for a speaker ID, caching it for subsequent utterances"""
+        label = self._speaker_label_cache.get(speaker)
+        if label is None:
+            label = self._speaker_label_cache[speaker] = f"Speaker {speaker}"
+        return label
+    
     def save_transcription(self, audio_path: str, transcription: str, same_as_input: bool = False) -> str:
         """Save transcription to file
 
@@ -200,21 +324,21 @@ class Transcriber:
             same_as_input: If True, save in the same directory as the audio file
         """
         try:
+            audio_path = Path(audio_path)
             if same_as_input:
                 # Save in the same directory as the audio file
-                audio_dir = Path(audio_path).parent
-                out_path = audio_dir / f"{Path(audio_path).stem}_transcription.txt"
+                out_path = audio_path.parent / f"{audio_path.stem}_transcription.txt"
             else:
                 # Save in the configured output directory
-                out_path = Path(self.config.output_dir) / f"{Path(audio_path).stem}_transcription.txt"
+                out_path = Path(self.config.output_dir) / f"{audio_path.stem}_transcription.txt"
 
-            out_path.write_text(transcription, encoding='utf-8')
+            write_text_file(str(out_path), transcription)
             return str(out_path)
         except Exception as e:
-            print(f"Failed to save transcription: {e}")
+            logger.error("Failed to save transcription: %s", e)
             return ""
 
-    def save_transcript_data(self, audio_path: str, transcript: aai.Transcript, same_as_input: bool = False) -> dict:
+    def save_transcript_data(self, audio_path: str, transcript: "aai.Transcript", same_as_input: bool = False) -> dict:
         """Save full transcript data as JSON for FFmpeg workflow
 
         Args:
@@ -229,12 +353,13 @@ class Transcriber:
 
         try:
             # Determine output directory
+            audio_path = Path(audio_path)
             if same_as_input:
-                output_dir = Path(audio_path).parent
+                output_dir = audio_path.parent
             else:
                 output_dir = Path(self.config.output_dir)
 
-            base_name = Path(audio_path).stem
+            base_name = audio_path.stem
 
             # Build JSON data structure
             data = {
@@ -276,25 +401,25 @@ class Transcriber:
 
             # Save JSON file
             json_path = output_dir / f"{base_name}_data.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Encode to one string and write it once; json.dump would issue a write per token chunk
+            write_text_file(str(json_path), json.dumps(data, indent=2, ensure_ascii=False))
             saved_files['json'] = str(json_path)
-            print(f"DEBUG: Saved JSON data to {json_path}")
+            logger.debug("Saved JSON data to %s", json_path)
 
             # Save SRT captions
             srt_path = output_dir / f"{base_name}.srt"
             try:
                 srt_content = transcript.export_subtitles_srt()
-                srt_path.write_text(srt_content, encoding='utf-8')
+                write_text_file(str(srt_path), srt_content)
                 saved_files['srt'] = str(srt_path)
-                print(f"DEBUG: Saved SRT captions to {srt_path}")
+                logger.debug("Saved SRT captions to %s", srt_path)
             except Exception as e:
-                print(f"WARNING: Failed to export SRT captions: {e}")
+                logger.warning("Failed to export SRT captions: %s", e)
 
             return saved_files
 
         except Exception as e:
-            print(f"ERROR: Failed to save transcript data: {e}")
+            logger.error("Failed to save transcript data: %s", e)
             return saved_files
 
     def _ms_to_timestamp(self, milliseconds: int) -> str:
@@ -1,24 +1,102 @@
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
+from tkinter import messagebox
 import os
 import threading
-from typing import List
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Set, Tuple
 import time
-import json
+import logging
 
 from src.core.audio_handler import AudioHandler
 from src.core.transcriber import Transcriber
 from src.utils.config import Config
+from src.utils.files import write_text_file
 from src.core.errors import RecallError, APIKeyError, AudioHandlerError, TranscriptionError, SilentAudioError
 
+logger = logging.getLogger(__name__)
+
+def _build_filetypes(audio_formats, video_formats):
+    """Build the file dialog filter table for the given audio and video extensions"""
+    audio_patterns = " ".join(f"*{f}" for f in audio_formats)
+    video_patterns = " ".join(f"*{f}" for f in video_formats)
+    return (
+        ("All Media Files", f"{audio_patterns} {video_patterns}"),
+        ("Video Files", video_patterns),
+        ("Audio Files", audio_patterns),
+        ("All files", "*.*"),
+    )
+
+def _theme_color(color, mode: str) -> str:
+    """Resolve a CTk (light, dark) color pair for an appearance mode name ("Light" or "Dark")"""
+    if isinstance(color, (tuple, list)):
+        return color[0 if mode == "Light" else 1]
+    return color
+
+def _layout_frame(parent) -> tk.Frame:
+    """Plain tk.Frame painted in the parent CTkFrame's color, for grouping widgets.
+
+    CTkFrame redraws its rounded background on a canvas on every resize, which
+    containers that are only there for layout don't need.
+    """
+    fg_color = parent.cget("fg_color")
+    frame = tk.Frame(parent, bg=_theme_color(fg_color, ctk.get_appearance_mode()), highlightthickness=0)
+    # Plain Tk widgets don't follow light/dark switches by themselves; CTk hooks the
+    # frame's configure so a new bg is passed on to the CTk widgets inside it too
+    ctk.AppearanceModeTracker.add(lambda mode: frame.configure(bg=_theme_color(fg_color, mode)), frame)
+    return frame
+
+def _text_panel(parent, height: int, font: ctk.CTkFont) -> Tuple[tk.Frame, tk.Text]:
+    """Native tk.Text with a scrollbar, colored from the CTkTextbox theme.
+
+    Returns the container to lay out and the text widget to write to. CTkTextbox
+    draws its border on a canvas, which the panels that receive streaming output
+    don't need. Colors follow appearance mode switches and the font follows
+    widget scaling, as they would for a CTk widget.
+    """
+    theme = ctk.ThemeManager.theme["CTkTextbox"]
+    
+    def apply_colors(mode):
+        fg = _theme_color(theme["text_color"], mode)
+        text.configure(bg=_theme_color(theme["fg_color"], mode), fg=fg, insertbackground=fg)
+    
+    def apply_scaling(widget_scaling, window_scaling):
+        text.configure(font=font.create_scaled_tuple(widget_scaling))
+    
+    container = _layout_frame(parent)
+    text = tk.Text(container, height=height, bd=0, highlightthickness=0, padx=6, pady=4)
+    apply_colors(ctk.get_appearance_mode())
+    apply_scaling(ctk.ScalingTracker.get_widget_scaling(parent), None)
+    ctk.AppearanceModeTracker.add(apply_colors, text)
+    ctk.ScalingTracker.add_widget(apply_scaling, text)
+    
+    scrollbar = ctk.CTkScrollbar(container, command=text.yview)
+    text.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    return container, text
+
 class TranscriberApp(ctk.CTk):
-    def __init__(self):
+    # Lines kept in the output log; older lines are trimmed so redraw cost stays bounded
+    MAX_LOG_LINES = 500
+    # Minimum delay between progress/log redraws (~30 Hz) while updates are streaming in
+    PROGRESS_FLUSH_MS = 33
+    # Status label colors; unknown statuses fall back to gray
+    STATUS_COLORS = {
+        "info": "gray",
+        "preparing": "orange",
+        "uploading": "blue",
+        "transcribing": "purple",
+        "completed": "green",
+        "error": "red"
+    }
+    
+    def __init__(self, config: Config = None):
         super().__init__()
         
         # Initialize components
-        self.config = Config()
+        self.config = config if config is not None else Config()
         
         # Load API key from config file if not already set
         if not self.config.api_key:
@@ -27,19 +105,60 @@ class TranscriberApp(ctk.CTk):
                 self.config.api_key = saved_api_key
         
         self.audio_handler = AudioHandler(self.config)
-        self.transcriber = Transcriber(self.config)
+        self._transcriber = None  # Built on first use; see the transcriber property
+        
+        # File dialog filters are fixed for the process lifetime, so build them once
+        self._filetypes = _build_filetypes(Config.SUPPORTED_FORMATS, Config.SUPPORTED_VIDEO_FORMATS)
         
         # Setup GUI
         self.title("Recall")
         self.geometry("800x700")  # Made window larger for metrics
-        self.setup_ui()
+        # Keep the window hidden while widgets are packed so it maps once with the full layout
+        self.withdraw()
+        try:
+            self.setup_ui()
+        finally:
+            self.deiconify()
         
         # State variables
         self.processing = False
+        self._cancel_event = threading.Event()  # Set by the Cancel button; checked by pool workers
         self.current_files: List[str] = []
+        self._current_dirs: Set[str] = set()  # Distinct source directories of current_files
+        self._file_meta: List[Tuple[str, str, str]] = []  # (path, directory, filename) per selected file
         self.start_time = None
+        self._last_elapsed = None
+        self._elapsed_after_id = None
+        self._last_status = (None, None)
+        self._last_progress = -1.0
+        
+        # Log timestamps only change once a second, so the formatted string is reused within it
+        self._ts_sec = 0
+        self._ts_str = ''
+        
+        # Progress updates arrive from the worker thread; bursts are coalesced into one redraw
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._pending_log_lines = deque(maxlen=self.MAX_LOG_LINES)
+        self._progress_scheduled = False
+        # End-of-run status; applied after any progress still waiting to be drawn
+        self._final_status = None
+        # Latest metrics text, kept apart so later updates without metrics don't drop it
+        self._pending_metrics = None
+        self._summary_due = False
+        
+        # API key dialog, built on first open and then reused
+        self._api_key_dialog = None
+        self._api_key_entry = None
     
     def setup_ui(self):
+        # Shared font objects; widgets reference these instead of each parsing its own tuple
+        self.font_small = ctk.CTkFont(family="Arial", size=10)
+        self.font_normal = ctk.CTkFont(family="Arial", size=12)
+        self.font_bold = ctk.CTkFont(family="Arial", size=12, weight="bold")
+        self.font_title = ctk.CTkFont(family="Arial", size=16, weight="bold")
+        self.font_large = ctk.CTkFont(family="Arial", size=20)
+        
         # Create menu bar
         self.setup_menu()
         
@@ -52,7 +171,7 @@ class TranscriberApp(ctk.CTk):
         self.left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
         
         # File selection buttons
-        self.btn_frame = ctk.CTkFrame(self.left_frame)
+        self.btn_frame = _layout_frame(self.left_frame)
         self.btn_frame.pack(fill=tk.X, pady=10)
         
         self.select_file_btn = ctk.CTkButton(
@@ -70,21 +189,23 @@ class TranscriberApp(ctk.CTk):
         self.select_dir_btn.pack(side=tk.LEFT, padx=5)
         
         # Output directory selection
-        self.output_frame = ctk.CTkFrame(self.left_frame)
+        self.output_frame = _layout_frame(self.left_frame)
         self.output_frame.pack(fill=tk.X, pady=5)
+        # Laid out on a grid so a resize only re-sizes the entry column
+        self.output_frame.columnconfigure(1, weight=1)
         
         self.output_label = ctk.CTkLabel(
             self.output_frame,
             text="Output Directory:",
-            font=("Arial", 12)
+            font=self.font_normal
         )
-        self.output_label.pack(side=tk.LEFT, padx=5)
+        self.output_label.grid(row=0, column=0, padx=5)
         
         self.output_path = ctk.CTkEntry(
             self.output_frame,
             placeholder_text="Select output directory..."
         )
-        self.output_path.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.output_path.grid(row=0, column=1, sticky="ew", padx=5)
         self.output_path.insert(0, self.config.output_dir)
         
         self.select_output_btn = ctk.CTkButton(
@@ -93,7 +214,7 @@ class TranscriberApp(ctk.CTk):
             command=self.select_output_directory,
             width=60
         )
-        self.select_output_btn.pack(side=tk.RIGHT, padx=5)
+        self.select_output_btn.grid(row=0, column=3, padx=5)
         
         # Same as input directory checkbox
         self.same_dir_var = tk.BooleanVar(value=False)
@@ -103,10 +224,10 @@ class TranscriberApp(ctk.CTk):
             variable=self.same_dir_var,
             command=self.toggle_same_directory
         )
-        self.same_dir_checkbox.pack(side=tk.RIGHT, padx=5)
+        self.same_dir_checkbox.grid(row=0, column=2, padx=5)
 
         # Export timestamps checkbox (for FFmpeg workflow)
-        self.export_timestamps_frame = ctk.CTkFrame(self.left_frame)
+        self.export_timestamps_frame = _layout_frame(self.left_frame)
         self.export_timestamps_frame.pack(fill=tk.X, pady=5)
 
         self.export_timestamps_var = tk.BooleanVar(value=self.config.export_timestamps)
@@ -124,8 +245,8 @@ class TranscriberApp(ctk.CTk):
         self.files_label = ctk.CTkLabel(self.files_frame, text="Selected Files:")
         self.files_label.pack(anchor=tk.W)
         
-        self.files_text = ctk.CTkTextbox(self.files_frame, height=150)
-        self.files_text.pack(fill=tk.BOTH, expand=True)
+        files_box, self.files_text = _text_panel(self.files_frame, 8, self.font_normal)
+        files_box.pack(fill=tk.BOTH, expand=True)
         
         # Status frame
         self.status_frame = ctk.CTkFrame(self.left_frame)
@@ -135,7 +256,7 @@ class TranscriberApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             self.status_frame,
             text="Ready",
-            font=("Arial", 12, "bold")
+            font=self.font_bold
         )
         self.status_label.pack(pady=5)
         
@@ -143,7 +264,7 @@ class TranscriberApp(ctk.CTk):
         self.progress_details = ctk.CTkLabel(
             self.status_frame,
             text="",
-            font=("Arial", 10)
+            font=self.font_small
         )
         self.progress_details.pack(pady=2)
         
@@ -160,25 +281,31 @@ class TranscriberApp(ctk.CTk):
         )
         self.transcribe_btn.pack(pady=10)
         
+        # The metrics column and output log are only written to once a run
+        # starts, so build them after the first paint of the controls
+        self.after_idle(self._build_side_panels)
+    
+    def _build_side_panels(self):
+        """Build the metrics column and output log below the main controls"""
         # Right column for metrics
         self.right_frame = ctk.CTkFrame(self.main_frame)
         self.right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=5, pady=5)
         
         # Elapsed time
-        self.time_frame = ctk.CTkFrame(self.right_frame)
+        self.time_frame = _layout_frame(self.right_frame)
         self.time_frame.pack(fill=tk.X, pady=5)
         
         self.time_label = ctk.CTkLabel(
             self.time_frame,
             text="Elapsed Time:",
-            font=("Arial", 12, "bold")
+            font=self.font_bold
         )
         self.time_label.pack()
         
         self.elapsed_time = ctk.CTkLabel(
             self.time_frame,
             text="00:00:00",
-            font=("Arial", 20)
+            font=self.font_large
         )
         self.elapsed_time.pack(pady=5)
         
@@ -186,19 +313,19 @@ class TranscriberApp(ctk.CTk):
         self.metrics_label = ctk.CTkLabel(
             self.right_frame,
             text="Performance Metrics",
-            font=("Arial", 12, "bold")
+            font=self.font_bold
         )
         self.metrics_label.pack(pady=(10,5))
         
-        self.metrics_text = ctk.CTkTextbox(self.right_frame, height=200)
-        self.metrics_text.pack(fill=tk.BOTH, expand=True)
+        metrics_box, self.metrics_text = _text_panel(self.right_frame, 11, self.font_normal)
+        metrics_box.pack(fill=tk.BOTH, expand=True)
         
         # Output log at the bottom
         self.log_label = ctk.CTkLabel(self.main_frame, text="Output Log:")
         self.log_label.pack(anchor=tk.W, pady=(10,0))
         
-        self.log_text = ctk.CTkTextbox(self.main_frame, height=150)
-        self.log_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        log_box, self.log_text = _text_panel(self.main_frame, 8, self.font_normal)
+        log_box.pack(fill=tk.BOTH, expand=True, pady=5)
     
     def show_error_message(self, title: str, message: str):
         """Safely show an error message box from any thread."""
@@ -222,12 +349,37 @@ class TranscriberApp(ctk.CTk):
     
     def show_api_key_dialog(self):
         """Show dialog to input and save API key"""
+        # The dialog is built once and hidden between uses
+        if self._api_key_dialog is None:
+            self._build_api_key_dialog()
+        dialog = self._api_key_dialog
+        
+        # Get current API key if it exists
+        current_api_key = getattr(self.config, 'api_key', '') or ''
+        self._api_key_entry.delete(0, tk.END)
+        if current_api_key:
+            self._api_key_entry.insert(0, current_api_key)
+        
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()  # Make it modal
+        
+        # Focus on the entry field
+        self._api_key_entry.focus()
+    
+    def _hide_api_key_dialog(self):
+        """Release the modal grab and hide the API key dialog for reuse"""
+        self._api_key_dialog.grab_release()
+        self._api_key_dialog.withdraw()
+    
+    def _build_api_key_dialog(self):
+        """Create the API key dialog widgets; called on first use"""
         # Create a custom dialog window
         dialog = ctk.CTkToplevel(self)
         dialog.title("API Key Configuration")
         dialog.geometry("500x200")
         dialog.transient(self)  # Make it modal
-        dialog.grab_set()  # Make it modal
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_api_key_dialog)
         
         # Center the dialog
         dialog.update_idletasks()
@@ -243,7 +395,7 @@ class TranscriberApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             main_frame, 
             text="AssemblyAI API Key Configuration",
-            font=("Arial", 16, "bold")
+            font=self.font_title
         )
         title_label.pack(pady=(0, 10))
         
@@ -251,21 +403,18 @@ class TranscriberApp(ctk.CTk):
         info_label = ctk.CTkLabel(
             main_frame,
             text="Enter your AssemblyAI API key. You can get one at: https://www.assemblyai.com/",
-            font=("Arial", 10),
+            font=self.font_small,
             wraplength=450
         )
         info_label.pack(pady=(0, 10))
         
         # API Key input
-        api_key_frame = ctk.CTkFrame(main_frame)
+        api_key_frame = _layout_frame(main_frame)
         api_key_frame.pack(fill=tk.X, pady=(0, 10))
         
         api_key_label = ctk.CTkLabel(api_key_frame, text="API Key:")
         api_key_label.pack(side=tk.LEFT, padx=(10, 5))
         
-        # Get current API key if it exists
-        current_api_key = getattr(self.config, 'api_key', '') or ''
-        
         api_key_entry = ctk.CTkEntry(
             api_key_frame, 
             placeholder_text="Enter your AssemblyAI API key...",
@@ -273,11 +422,9 @@ class TranscriberApp(ctk.CTk):
             show="*"  # Hide the API key
         )
         api_key_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        if current_api_key:
-            api_key_entry.insert(0, current_api_key)
         
         # Buttons
-        button_frame = ctk.CTkFrame(main_frame)
+        button_frame = _layout_frame(main_frame)
         button_frame.pack(fill=tk.X)
         
         def save_api_key():
@@ -286,6 +433,11 @@ class TranscriberApp(ctk.CTk):
                 messagebox.showerror("Error", "Please enter an API key.")
                 return
             
+            # Nothing to write or rebuild if the key didn't change
+            if api_key == self.config.api_key:
+                self._hide_api_key_dialog()
+                return
+            
             try:
                 # Save API key to config file
                 self.save_api_key_to_config(api_key)
@@ -293,22 +445,20 @@ class TranscriberApp(ctk.CTk):
                 # Update the current config
                 self.config.api_key = api_key
                 
-                # Recreate the transcriber with new API key
-                self.transcriber = Transcriber(self.config)
+                # Recreate the transcriber with new API key on next use
+                Transcriber.invalidate()
+                self._transcriber = None
                 
                 messagebox.showinfo("Success", "API key saved successfully!")
-                dialog.destroy()
+                self._hide_api_key_dialog()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save API key: {str(e)}")
         
-        def cancel():
-            dialog.destroy()
-        
         cancel_btn = ctk.CTkButton(
             button_frame, 
             text="Cancel", 
-            command=cancel,
+            command=self._hide_api_key_dialog,
             width=100
         )
         cancel_btn.pack(side=tk.RIGHT, padx=(5, 10), pady=10)
@@ -321,8 +471,8 @@ class TranscriberApp(ctk.CTk):
         )
         save_btn.pack(side=tk.RIGHT, padx=(0, 5), pady=10)
         
-        # Focus on the entry field
-        api_key_entry.focus()
+        self._api_key_dialog = dialog
+        self._api_key_entry = api_key_entry
     
     def show_about_dialog(self):
         """Show about dialog"""
@@ -339,39 +489,16 @@ class TranscriberApp(ctk.CTk):
         messagebox.showinfo("About", about_text)
     
     def save_api_key_to_config(self, api_key: str):
-        """Save API key to a config file"""
-        config_dir = os.path.expanduser("~/.recall")
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "config.json")
-        
-        # Load existing config or create new one
-        try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            config_data = {}
-        
-        # Update API key
-        config_data['api_key'] = api_key
-        
-        # Save config
-        with open(config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        """Save API key to config file"""
+        self.config.save_api_key_to_config(api_key)
     
     def load_api_key_from_config(self) -> str:
         """Load API key from config file"""
-        config_dir = os.path.expanduser("~/.recall")
-        config_file = os.path.join(config_dir, "config.json")
-        
-        try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-                return config_data.get('api_key', '')
-        except (FileNotFoundError, json.JSONDecodeError):
-            return ''
+        return self.config.load_api_key_from_config()
     
     def select_output_directory(self):
         """Select output directory for transcriptions"""
+        from tkinter import filedialog  # Only needed once a dialog is opened
         dir_path = filedialog.askdirectory(initialdir=self.config.output_dir)
         if dir_path:
             self.config.output_dir = dir_path
@@ -380,44 +507,71 @@ class TranscriberApp(ctk.CTk):
             
     def select_files(self):
         """Select multiple audio or video files for transcription"""
-        audio_formats = " ".join(f"*{f}" for f in self.config.supported_formats)
-        video_formats = " ".join(f"*{f}" for f in self.config.supported_video_formats)
-        all_formats = f"{audio_formats} {video_formats}"
-        
-        filetypes = [
-            ("All Media Files", all_formats),
-            ("Video Files", video_formats),
-            ("Audio Files", audio_formats),
-            ("All files", "*.*")
-        ]
-        
-        file_paths = filedialog.askopenfilenames(filetypes=filetypes)
+        from tkinter import filedialog
+        file_paths = filedialog.askopenfilenames(filetypes=self._filetypes)
         if file_paths:
-            self.current_files = list(file_paths)
-            self.update_files_list()
-            self.update_status("Ready", "info")
+            self._set_current_files(file_paths)
+            # Let the dialog close and the window redraw before filling the (possibly long) list
+            self.after_idle(self.update_files_list)
+            self.after_idle(self.update_status, "Ready", "info")
             
             if self.same_dir_var.get():
-                directories = {os.path.dirname(path) for path in file_paths}
-                if len(directories) == 1:
+                if len(self._current_dirs) == 1:
                     self.output_path.delete(0, tk.END)
-                    self.output_path.insert(0, list(directories)[0])
+                    self.output_path.insert(0, next(iter(self._current_dirs)))
                 else:
                     self.output_path.delete(0, tk.END)
                     self.output_path.insert(0, "[Multiple source directories]")
     
     def select_directory(self):
+        from tkinter import filedialog
         dir_path = filedialog.askdirectory()
         if dir_path:
-            self.current_files = self.audio_handler.get_audio_files(dir_path)
-            self.update_files_list()
-            self.update_status("Ready", "info")
-            
-            # Update output directory if checkbox is checked
-            if self.same_dir_var.get():
-                self.output_path.delete(0, tk.END)
-                self.output_path.insert(0, dir_path)
-                self.config.output_dir = dir_path
+            # Large trees take a while to scan, so do it off the Tk thread. The selection and
+            # transcribe controls stay disabled until it finishes, so a late result can't
+            # replace a newer selection or change the list a run was started with
+            self._set_scan_controls_state(tk.DISABLED)
+            self.update_status("Scanning...", "info")
+            threading.Thread(target=self._scan_dir, args=(dir_path,), daemon=True).start()
+    
+    def _scan_dir(self, dir_path: str):
+        """Collect media files under dir_path on a background thread, then hand them to the Tk thread"""
+        try:
+            files = self.audio_handler.get_audio_files(dir_path)
+        except Exception as e:
+            self.show_error_message("Error", f"Failed to scan directory: {e}")
+            files = None
+        self.after(0, self._scan_dir_done, dir_path, files)
+    
+    def _set_scan_controls_state(self, state: str):
+        """Enable or disable the controls that must not be used while a directory scan runs"""
+        self.select_file_btn.configure(state=state)
+        self.select_dir_btn.configure(state=state)
+        self.transcribe_btn.configure(state=state)
+    
+    def _scan_dir_done(self, dir_path: str, files: Optional[List[str]]):
+        """Show the results of a directory scan; files is None if the scan failed"""
+        self._set_scan_controls_state(tk.NORMAL)
+        self.update_status("Ready", "info")
+        if files is None:
+            # Keep the previous selection
+            return
+        
+        self._set_current_files(files)
+        self.update_files_list()
+        
+        # Update output directory if checkbox is checked
+        if self.same_dir_var.get():
+            self.output_path.delete(0, tk.END)
+            self.output_path.insert(0, dir_path)
+            self.config.output_dir = dir_path
+    
+    def _set_current_files(self, paths: List[str]):
+        """Replace the selected files and split their paths once for display and processing"""
+        # Order-preserving dedupe so a path picked twice is only transcribed once
+        self.current_files = list(dict.fromkeys(paths))
+        self._file_meta = [(path, *os.path.split(path)) for path in self.current_files]
+        self._current_dirs = {file_dir for _, file_dir, _ in self._file_meta}
     
     def update_files_list(self):
         """Update the files list display with selected files"""
@@ -428,60 +582,109 @@ class TranscriberApp(ctk.CTk):
             
         # Show count of selected files
         file_count = len(self.current_files)
-        self.files_text.insert(tk.END, f"Selected {file_count} file{'s' if file_count != 1 else ''}:\n\n")
+        lines = [f"Selected {file_count} file{'s' if file_count != 1 else ''}:\n\n"]
         
-        for i, file in enumerate(self.current_files, 1):
-            file_name = os.path.basename(file)
-            file_dir = os.path.dirname(file)
-            self.files_text.insert(tk.END, f"{i}. {file_name}\n")
-            self.files_text.insert(tk.END, f"   {file_dir}\n\n")
+        # Build the whole listing first so the widget is updated with a single insert
+        for i, (_, file_dir, file_name) in enumerate(self._file_meta, 1):
+            lines.append(f"{i}. {file_name}\n   {file_dir}\n\n")
+        self.files_text.insert(tk.END, "".join(lines))
     
     def update_status(self, message: str, status: str):
         """Update status with color coding"""
-        status_colors = {
-            "info": "gray",
-            "preparing": "orange",
-            "uploading": "blue",
-            "transcribing": "purple",
-            "completed": "green",
-            "error": "red"
-        }
-        color = status_colors.get(status, "gray")
-        self.status_label.configure(text=message, text_color=color)
+        color = self.STATUS_COLORS.get(status, "gray")
+        # Progress flushes repeat the same status many times; only reconfigure on a change
+        if (message, color) != self._last_status:
+            self._last_status = (message, color)
+            self.status_label.configure(text=message, text_color=color)
     
     def update_elapsed_time(self):
         """Update the elapsed time display"""
         if self.start_time and self.processing:
-            elapsed = time.time() - self.start_time
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
+            elapsed_ms = int((time.time() - self.start_time) * 1000)
+            elapsed = elapsed_ms // 1000
             
-            self.elapsed_time.configure(
-                text=f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            )
+            # Only touch the widget when the displayed second actually changes
+            if elapsed != self._last_elapsed:
+                self._last_elapsed = elapsed
+                minutes, seconds = divmod(elapsed, 60)
+                hours, minutes = divmod(minutes, 60)
+                self.elapsed_time.configure(
+                    text=f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                )
             
-            # Schedule next update
-            self.after(1000, self.update_elapsed_time)
+            # Schedule the next update for just after the next whole second, so ticks don't drift
+            self._elapsed_after_id = self.after(1000 - elapsed_ms % 1000, self.update_elapsed_time)
     
     def update_progress(self, message: str, progress: float, status: str, extra: dict = None):
-        """Update progress with detailed information"""
-        self.update_status(status.title(), status)
-        self.progress_details.configure(text=message)
-        self.progress_bar.set(progress / 100)
-        
-        # Log the message with timestamp
-        timestamp = datetime.now().strftime("%I:%M:%S %p")  # 12-hour clock with AM/PM
-        log_message = f"[{timestamp}] {message}"
+        """Queue a progress update; the UI is redrawn at most every PROGRESS_FLUSH_MS with the latest state"""
+        with self._progress_lock:
+            # Log the message with timestamp
+            now = int(time.time())
+            if now != self._ts_sec:
+                self._ts_sec = now
+                self._ts_str = time.strftime("%I:%M:%S %p", time.localtime(now))  # 12-hour clock with AM/PM
+            
+            self._pending_progress = (message, progress, status, extra)
+            if extra and "metrics" in extra:
+                self._pending_metrics = extra["metrics"]
+                self._summary_due = status == "completed"
+            self._pending_log_lines.append(f"[{self._ts_str}] {message}")
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        self.after(self.PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def finish_progress(self, message: str, status: str):
+        """Queue the run's final status so it is drawn after, not before, any pending progress"""
+        with self._progress_lock:
+            self._final_status = (message, status)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        self.after(self.PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Render the most recent progress state and any pending log lines on the Tk thread"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            final_status = self._final_status
+            metrics, summary_due = self._pending_metrics, self._summary_due
+            self._pending_metrics = None
+            self._summary_due = False
+            log_text = "\n".join(self._pending_log_lines) + "\n" if self._pending_log_lines else ""
+            self._pending_log_lines.clear()
+            self._progress_scheduled = False
+        
+        if pending is not None:
+            message, progress, status, _ = pending
+            self.update_status(status.title(), status)
+            self.progress_details.configure(text=message)
+            # The bar can't show sub-percent changes, so skip the Tk call for them
+            fraction = progress * 0.01
+            if abs(fraction - self._last_progress) >= 0.005:
+                self._last_progress = fraction
+                self.progress_bar.set(fraction)
         
         # Add metrics if available
-        if extra and "metrics" in extra:
+        if metrics is not None:
             self.metrics_text.delete("0.0", tk.END)
-            self.metrics_text.insert(tk.END, extra["metrics"])
-            if status == "completed":
+            self.metrics_text.insert(tk.END, metrics)
+            if summary_due:
                 self.metrics_text.insert(tk.END, "\n\n" + self.transcriber.get_performance_summary())
         
-        self.log_text.insert(tk.END, log_message + "\n")
+        # Once the run has ended its status wins over any progress that arrived with or after it
+        if final_status is not None:
+            self.update_status(*final_status)
+        
+        if not log_text:
+            return
+        self.log_text.insert(tk.END, log_text)
+        
+        # Keep only the most recent lines in the widget (the text always ends with an empty line)
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > self.MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{line_count - self.MAX_LOG_LINES + 1}.0")
         self.log_text.see(tk.END)
     
     def toggle_same_directory(self):
@@ -489,10 +692,9 @@ class TranscriberApp(ctk.CTk):
         if self.same_dir_var.get():
             # If we have files selected, show appropriate directory info
             if self.current_files:
-                directories = [os.path.dirname(path) for path in self.current_files]
-                if len(set(directories)) == 1:
+                if len(self._current_dirs) == 1:
                     # All files are from the same directory
-                    input_dir = directories[0]
+                    input_dir = next(iter(self._current_dirs))
                     self.output_path.delete(0, tk.END)
                     self.output_path.insert(0, input_dir)
                 else:
@@ -513,7 +715,8 @@ class TranscriberApp(ctk.CTk):
     def start_transcription(self):
         """Validate inputs and start the transcription process in a background thread."""
         if self.processing:
-            messagebox.showwarning("In Progress", "A transcription is already in progress.")
+            # While a run is active the button acts as Cancel
+            self.cancel_transcription()
             return
             
         if not self.current_files:
@@ -529,102 +732,195 @@ class TranscriberApp(ctk.CTk):
             return
             
         self.processing = True
+        self._cancel_event.clear()
+        self.transcribe_btn.configure(text="Cancel")
         self.start_time = time.time()
+        self._last_elapsed = None
         self.log_text.delete('1.0', tk.END)
         self.metrics_text.delete('1.0', tk.END)
+        with self._progress_lock:
+            self._final_status = None
+            self._pending_metrics = None
+            self._summary_due = False
         
         self.update_status("Starting...", "processing")
         self.update_elapsed_time()
 
+        # Read everything the worker needs from Tk here, on the main thread; Tk is not thread-safe
+        settings = (
+            list(self._file_meta),
+            self.export_timestamps_var.get(),
+            self.same_dir_var.get(),
+            self.output_path.get(),
+        )
+        
         # Run file processing in a separate thread to keep UI responsive
-        thread = threading.Thread(target=self.process_files)
+        thread = threading.Thread(target=self.process_files, args=settings)
         thread.daemon = True
         thread.start()
 
-    def process_files(self):
+    def cancel_transcription(self):
+        """Stop the current run; waiting transcriptions are abandoned at their next poll"""
+        self._cancel_event.set()
+        self.transcribe_btn.configure(state=tk.DISABLED)
+        self.update_status("Cancelling...", "processing")
+
+    @property
+    def transcriber(self) -> Transcriber:
+        """The app's Transcriber, created lazily so startup doesn't pay for importing the AssemblyAI SDK"""
+        if self._transcriber is None:
+            self._transcriber = Transcriber(self.config)
+        return self._transcriber
+    
+    def _worker_transcriber(self) -> Transcriber:
+        """Return the calling pool worker's own Transcriber, creating it on first use"""
+        transcriber = getattr(self._worker_local, 'transcriber', None)
+        if transcriber is None:
+            # Transcriber keeps per-file state (last_transcript), so workers must not share one
+            transcriber = self._worker_local.transcriber = Transcriber(self.config)
+            # Metrics are pooled on the app's transcriber so the performance summary covers every worker
+            transcriber.metrics = self._run_metrics
+        return transcriber
+    
+    def _process_one(self, file_path: str, filename: str, output_dir: str,
+                     export_timestamps: bool, same_as_input: bool) -> dict:
         """
-        The core file processing logic that runs in a background thread.
-        Handles audio preparation, transcription, and progress updates.
+        Prepare, transcribe and save a single file. Runs on a pool worker thread,
+        so it must never touch Tk widgets; results are reported back to process_files.
         """
-        try:
-            total_files = len(self.current_files)
-            
-            for i, file_path in enumerate(self.current_files):
-                if not self.processing:
-                    self.update_status("Cancelled", "cancelled")
-                    break
+        result = {'filename': filename, 'exported': None}
+        if self._cancel_event.is_set():
+            result['cancelled'] = True
+            return result
+        
+        transcriber = self._worker_transcriber()
+        
+        # Prepare audio file for transcription; decoding holds the whole file in memory,
+        # so files are prepared one at a time and only uploads and polling overlap
+        with self._prepare_slots:
+            prepared_path = self.audio_handler.prepare_audio(file_path)
+        
+        # Transcribe the prepared file
+        transcript = transcriber.transcribe_file(prepared_path, self._relay_file_progress, self._cancel_event)
+        
+        # Clean up the temporary file if one was created
+        if prepared_path != file_path:
+            self.audio_handler.cleanup_temp_file(prepared_path)
+        
+        if not transcript or transcript.strip() == "":
+            raise SilentAudioError("Transcription returned empty or silent result.")
 
-                progress_percent = (i / total_files) * 100
-                self.update_progress(f"Processing {os.path.basename(file_path)}...", progress_percent, "processing")
-                
-                try:
-                    # Prepare audio file for transcription
-                    prepared_path = self.audio_handler.prepare_audio(file_path)
-                    
-                    # Transcribe the prepared file
-                    transcript = self.transcriber.transcribe_file(prepared_path)
-                    
-                    # Clean up the temporary file if one was created
-                    if prepared_path != file_path:
-                        self.audio_handler.cleanup_temp_file(prepared_path)
-                    
-                    if not transcript or transcript.strip() == "":
-                        raise SilentAudioError("Transcription returned empty or silent result.")
+        # Save the transcript
+        output_filename = f"{os.path.splitext(filename)[0]}_transcription.txt"
+        output_filepath = os.path.join(output_dir, output_filename)
+        write_text_file(output_filepath, transcript)
+        result['transcript_path'] = output_filepath
 
-                    # Save the transcript
-                    output_dir = self.output_path.get()
-                    if self.same_dir_var.get():
-                        output_dir = os.path.dirname(file_path)
+        # Export timestamps and captions if checkbox is checked
+        if export_timestamps and transcriber.last_transcript:
+            try:
+                result['exported'] = transcriber.save_transcript_data(
+                    file_path,
+                    transcriber.last_transcript,
+                    same_as_input=same_as_input
+                )
+            except Exception as e:
+                logger.warning("Failed to export timestamps: %s", e)
+        
+        return result
 
-                    filename = os.path.basename(file_path)
-                    output_filename = f"{os.path.splitext(filename)[0]}_transcription.txt"
-                    output_filepath = os.path.join(output_dir, output_filename)
+    def _relay_file_progress(self, message: str, progress: float, status: str, extra: dict = None):
+        """Forward a worker's per-file status and metrics to the UI at the batch's overall progress"""
+        # Failures are raised to process_files, which reports them once per file
+        if progress >= 0:
+            self.update_progress(message, self._batch_progress, status, extra)
 
+    def process_files(self, files: List[Tuple[str, str, str]], export_timestamps: bool, same_as_input: bool, base_output_dir: str):
+        """
+        The core file processing logic that runs in a background thread.
+        Files are handed to a bounded worker pool so uploads and AssemblyAI polling
+        overlap across files; this thread only collects results and reports progress.
+        Settings are snapshotted by start_transcription so no Tk variable is read here;
+        files holds (path, directory, filename) tuples split once at selection time.
+        """
+        total_files = len(files)
+        self._worker_local = threading.local()
+        self._prepare_slots = threading.BoundedSemaphore(1)
+        self._run_metrics = self.transcriber.metrics  # Resolved before any worker starts
+        self._batch_progress = 0.0
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.config.assemblyai_max_concurrency, total_files)),
+            thread_name_prefix="recall-transcribe"
+        )
+        try:
+            self.update_progress(f"Processing {total_files} files...", 0, "processing")
+            created_dirs: Set[str] = set()
+            
+            futures = {}
+            for file_path, source_dir, filename in files:
+                output_dir = source_dir if same_as_input else base_output_dir
+                
+                # Create each distinct output directory once per run, not once per file
+                if output_dir not in created_dirs:
                     os.makedirs(output_dir, exist_ok=True)
-                    with open(output_filepath, 'w', encoding='utf-8') as f:
-                        f.write(transcript)
-
-                    # Export timestamps and captions if checkbox is checked
-                    if self.export_timestamps_var.get() and self.transcriber.last_transcript:
-                        try:
-                            saved_files = self.transcriber.save_transcript_data(
-                                file_path,
-                                self.transcriber.last_transcript,
-                                same_as_input=self.same_dir_var.get()
-                            )
-
-                            # Log which files were saved
-                            if saved_files:
-                                log_msg = f"  → Exported: "
-                                if 'json' in saved_files:
-                                    log_msg += f"JSON data, "
-                                if 'srt' in saved_files:
-                                    log_msg += f"SRT captions"
-                                self.log_text.insert(tk.END, log_msg + "\n")
-                                self.log_text.see(tk.END)
-                        except Exception as e:
-                            print(f"WARNING: Failed to export timestamps: {e}")
-
-                    self.update_progress(f"✓ Completed {filename}", progress_percent, "processing", extra={'transcript_path': output_filepath})
-
+                    created_dirs.add(output_dir)
+                
+                future = pool.submit(self._process_one, file_path, filename, output_dir,
+                                     export_timestamps, same_as_input)
+                futures[future] = filename
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                filename = futures[future]
+                progress_percent = self._batch_progress = (done / total_files) * 100
+                
+                try:
+                    result = future.result()
                 except (AudioHandlerError, TranscriptionError) as e:
-                    self.update_progress(f"✗ Error on {os.path.basename(file_path)}: {e}", progress_percent, "error")
+                    # Failures caused by cancelling aren't worth reporting per file
+                    if not self._cancel_event.is_set():
+                        self.update_progress(f"✗ Error on {filename}: {e}", progress_percent, "error")
+                    continue
+                
+                if result.get('cancelled'):
+                    continue
+                
+                self.update_progress(f"✓ Completed {filename}", progress_percent, "processing",
+                                     extra={'transcript_path': result['transcript_path']})
+                
+                # Log which files were exported
+                saved_files = result['exported']
+                if saved_files:
+                    log_msg = f"  → Exported: "
+                    if 'json' in saved_files:
+                        log_msg += f"JSON data, "
+                    if 'srt' in saved_files:
+                        log_msg += f"SRT captions"
+                    self.update_progress(log_msg, progress_percent, "processing")
                 
-            if self.processing:
-                self.update_status("Completed", "completed")
+            if not self._cancel_event.is_set():
+                self.finish_progress("Completed", "completed")
+            else:
+                self.finish_progress("Cancelled", "cancelled")
             
         except APIKeyError as e:
             self.show_error_message("API Key Error", str(e))
-            self.update_status("Failed", "error")
+            self.finish_progress("Failed", "error")
         except Exception as e:
             self.show_error_message("An Unexpected Error Occurred", f"An unexpected error occurred: {e}")
-            self.update_status("Failed", "error")
+            self.finish_progress("Failed", "error")
         finally:
+            # Files not yet started are dropped; in-flight ones finish before temp files are removed
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.audio_handler.cleanup_all_temp_files()
             self.processing = False
             self.after(0, self.reset_ui_state)
 
     def reset_ui_state(self):
         """Resets the UI controls to their default, non-processing state."""
+        # Stop the elapsed-time tick now rather than letting one more run notice processing ended
+        if self._elapsed_after_id is not None:
+            self.after_cancel(self._elapsed_after_id)
+            self._elapsed_after_id = None
         self.transcribe_btn.configure(text="Start Transcription", state=tk.NORMAL)
         self.select_file_btn.configure(state=tk.NORMAL)
         self.select_dir_btn.configure(state=tk.NORMAL)
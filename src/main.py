@@ -1,13 +1,21 @@
-from src.gui.app import TranscriberApp
-import customtkinter as ctk
+import logging
+
+from src.utils.config import Config
 
 def main():
+    config = Config()
+    logging.basicConfig(level=config.log_level)
+    
+    # Tk and customtkinter are only loaded once the GUI is actually launched
+    import customtkinter as ctk
+    from src.gui.app import TranscriberApp
+    
     # Set appearance mode and default color theme
     ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
     ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
     
     # Create and run the application
-    app = TranscriberApp()
+    app = TranscriberApp(config)
     app.mainloop()
 
 if __name__ == "__main__":
@@ -1,9 +1,88 @@
 import os
+import re
+import stat
 import json
+from contextlib import contextmanager
+from functools import lru_cache
 from dotenv import load_dotenv
 from pathlib import Path
 
+from src.utils.files import write_text_file
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+@contextmanager
+def _exclusive_lock(lock_path):
+    """Hold an exclusive OS-level lock on a sidecar file for the duration of the block"""
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+# Settings are written with the same encoder every time, so build it once
+_encode_config = json.JSONEncoder(indent=2).encode
+
+@lru_cache(maxsize=1)
+def _load_config_cached(config_file, mtime_ns):
+    """Parse the config file; keyed on its mtime so a change on disk misses the cache"""
+    try:
+        with open(config_file, 'rb') as f:
+            return json.loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+# Supported extensions, lowercased
+_AUDIO_FORMATS = ('.amr', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.aac', '.wma')
+_VIDEO_FORMATS = ('.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv')
+
+def _extension_pattern(formats):
+    """Compile a case-insensitive regex matching a filename that ends in one of the formats.
+
+    The character before the dot must not be a path separator, so dotfiles such
+    as ".mp3" are not treated as having an extension (same as os.path.splitext).
+    """
+    alternatives = "|".join(re.escape(fmt[1:]) for fmt in formats)
+    return re.compile(rf"[^/\\]\.(?:{alternatives})\Z", re.IGNORECASE)
+
+# Per-file format checks run once per directory entry during scans, so they are a single C-level match
+_SUPPORTED_RE = _extension_pattern(_AUDIO_FORMATS + _VIDEO_FORMATS)
+_VIDEO_RE = _extension_pattern(_VIDEO_FORMATS)
+
+# Level names accepted for LOG_LEVEL
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+def _env_positive_int(name, default):
+    """Read a positive integer setting from the environment, falling back to default if unset or invalid"""
+    try:
+        value = int(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+# Output directories already created by this process, so later Config() calls skip the mkdir
+_created_output_dirs = set()
+# Settings directories known to exist, so repeated saves skip the makedirs
+_created_config_dirs = set()
+
 class Config:
+    # Supported extensions as plain class constants; the properties below return the same tuples
+    SUPPORTED_FORMATS = _AUDIO_FORMATS
+    SUPPORTED_VIDEO_FORMATS = _VIDEO_FORMATS
+    
     def __init__(self):
         # Load environment variables
         load_dotenv()
@@ -23,7 +102,23 @@ class Config:
         # Export timestamps option (for FFmpeg workflow)
         self.export_timestamps = os.getenv('EXPORT_TIMESTAMPS', 'false').lower() == 'true'
 
+        # Logging verbosity for the core modules (DEBUG, INFO, WARNING, ERROR)
+        # Unknown names fall back to INFO rather than failing logging.basicConfig at startup
+        log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+        self.log_level = log_level if log_level in _LOG_LEVELS else 'INFO'
+
+        # Maximum simultaneous AssemblyAI transcriptions across the whole process
+        self.assemblyai_max_concurrency = _env_positive_int('ASSEMBLYAI_MAX_CONCURRENCY', 4)
+
+        # Number of web transcription jobs processed at the same time; the rest wait in a queue
+        self.max_concurrent_jobs = _env_positive_int('MAX_CONCURRENT_JOBS', 4)
+
         # Only create directory if it's a valid path
+        if self.output_dir not in _created_output_dirs:
+            self._create_output_dir()
+
+    def _create_output_dir(self):
+        """Create the output directory, falling back to ./transcripts if the path is unusable"""
         try:
             # Convert to Path object to handle Windows paths properly
             output_path = Path(self.output_dir)
@@ -35,6 +130,7 @@ class Config:
             # If path creation fails, use default directory
             self.output_dir = 'transcripts'
             Path(self.output_dir).mkdir(exist_ok=True)
+        _created_output_dirs.add(self.output_dir)
     
     def load_api_key_from_config(self) -> str:
         """Load API key from config file"""
@@ -42,22 +138,56 @@ class Config:
         config_file = os.path.join(config_dir, "config.json")
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-                return config_data.get('api_key', '')
-        except (FileNotFoundError, json.JSONDecodeError):
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
             return ''
+        return _load_config_cached(config_file, mtime_ns).get('api_key', '')
+    
+    def save_api_key_to_config(self, api_key: str):
+        """Save API key to the config file, preserving any other settings"""
+        config_dir = os.path.expanduser("~/.recall")
+        if config_dir not in _created_config_dirs:
+            os.makedirs(config_dir, exist_ok=True)
+            _created_config_dirs.add(config_dir)
+        config_file = os.path.join(config_dir, "config.json")
+        
+        # Serialize writers and replace the file atomically so readers never see a partial write
+        with _exclusive_lock(os.path.join(config_dir, ".config.lock")):
+            try:
+                with open(config_file, 'rb') as f:
+                    config_data = json.loads(f.read())
+            except (FileNotFoundError, json.JSONDecodeError):
+                config_data = {}
+            
+            config_data['api_key'] = api_key
+            
+            # The file holds the API key: keep the existing file's permissions, owner-only for a new one
+            try:
+                mode = stat.S_IMODE(os.stat(config_file).st_mode)
+            except FileNotFoundError:
+                mode = 0o600
+            
+            temp_file = config_file + ".tmp"
+            write_text_file(temp_file, _encode_config(config_data), fsync=True, mode=0o600)
+            # A leftover temp file keeps its old mode, so set it explicitly before swapping it in
+            os.chmod(temp_file, mode)
+            os.replace(temp_file, config_file)
+        _load_config_cached.cache_clear()
     
     @property
     def supported_formats(self):
         """Return supported audio formats as an immutable tuple"""
-        return ('.amr', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.aac', '.wma')
+        return self.SUPPORTED_FORMATS
 
     @property
     def supported_video_formats(self):
         """Return supported video formats as an immutable tuple"""
-        return ('.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv')
+        return self.SUPPORTED_VIDEO_FORMATS
 
     def is_supported_format(self, filename):
         """Check if a file format is supported (audio or video)"""
-        return any(filename.lower().endswith(fmt) for fmt in self.supported_formats + self.supported_video_formats) 
\ No newline at end of file
+        return _SUPPORTED_RE.search(filename) is not None
+
+    def is_video_format(self, filename):
+        """Check if a file has a supported video extension"""
+        return _VIDEO_RE.search(filename) is not None
@@ -0,0 +1,21 @@
+import os
+
+# O_BINARY only exists on Windows, where it stops the CRT from translating newlines
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def write_text_file(path: str, text: str, fsync: bool = False, mode: int = 0o644):
+    """Write text to path as UTF-8, encoding it once and writing the bytes straight to the fd.
+
+    With fsync=True the data is flushed to disk before the file is closed. mode
+    only applies when the file is created (and is subject to the umask).
+    """
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, _WRITE_FLAGS, mode)
+    try:
+        # os.write may write fewer bytes than requested, so keep going until everything is out
+        while data:
+            data = data[os.write(fd, data):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
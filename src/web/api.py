@@ -13,19 +13,19 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 from flask import Flask, request, jsonify, render_template, send_file
-import threading
 import time
 from datetime import datetime
 import uuid
 from werkzeug.utils import secure_filename
-import json
 import logging
 
 from src.core.audio_handler import AudioHandler
 from src.core.transcriber import Transcriber
 from src.core.jobs import TranscriptionJob
+from src.core.job_queue import TranscriptionQueue
 from src.core.errors import RecallError, APIKeyError, AudioHandlerError, TranscriptionError, SilentAudioError
 from src.utils.config import Config
+from src.utils.files import write_text_file
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max file size
@@ -33,14 +33,14 @@ app.config['UPLOAD_FOLDER'] = os.path.join(project_root, 'uploads')
 
 # Initialize components
 config = Config()
+logging.basicConfig(level=config.log_level)
 audio_handler = AudioHandler(config)
-transcriber = Transcriber(config)
 
 # In-memory job tracking
 jobs = {}
 
 # Dynamically build allowed extensions from config
-ALLOWED_EXTENSIONS = {fmt.strip('.') for fmt in (config.supported_formats + config.supported_video_formats)}
+ALLOWED_EXTENSIONS = frozenset(fmt.strip('.') for fmt in (Config.SUPPORTED_FORMATS + Config.SUPPORTED_VIDEO_FORMATS))
 
 @app.errorhandler(RecallError)
 def handle_recall_error(error):
@@ -52,29 +52,53 @@ def handle_recall_error(error):
     return response
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
+
+class _JobProgressAdapter:
+    """Transcriber progress callback that folds per-file progress into the job's overall progress"""
+    __slots__ = ('job', 'file_index', 'total_files')
+    
+    def __init__(self, job, total_files):
+        self.job = job
+        self.file_index = 0
+        self.total_files = total_files
+    
+    def __call__(self, message, progress, status, extra=None):
+        # Negative progress signals an error; the job loop records those itself
+        if progress >= 0:
+            self.job.update_progress((self.file_index + progress / 100) / self.total_files * 100)
 
 def process_transcription_job(job_id):
     """Process transcription job in background"""
     job = jobs[job_id]
     job.status = "processing"
     job.start_time = datetime.now()
+    # Temp files this job created, so cleanup never touches files of jobs running alongside it
+    job_temp_files = []
     
     try:
+        # Each job gets its own transcriber (last_transcript is per-file state); the AssemblyAI
+        # client behind it is shared per API key, so this is cheap
+        job_transcriber = Transcriber(config)
         total_files = len(job.files)
+        progress_adapter = _JobProgressAdapter(job, total_files)
         
         for i, file_path in enumerate(job.files):
             job.current_file = os.path.basename(file_path)
-            job.progress = (i / total_files) * 100
+            job.update_progress((i / total_files) * 100)
+            progress_adapter.file_index = i
             
             try:
                 # Prepare audio file (convert AMR/other formats to WAV if needed)
                 prepared_path = audio_handler.prepare_audio(file_path)
                 if not prepared_path:
                     raise AudioHandlerError("Failed to prepare audio file for transcription")
+                if prepared_path != file_path:
+                    job_temp_files.append(prepared_path)
                 
                 # Transcribe the prepared file
-                transcript = transcriber.transcribe_file(prepared_path)
+                transcript = job_transcriber.transcribe_file(prepared_path, progress_adapter)
                 
                 # Clean up temporary file if it was created
                 if prepared_path != file_path:
@@ -116,8 +140,7 @@ def process_transcription_job(job_id):
                 if output_dir:  # Only create if there's a directory to create
                     os.makedirs(output_dir, exist_ok=True)
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(transcript)
+                write_text_file(output_path, transcript)
 
                 # Export timestamps and captions if requested
                 result_data = {
@@ -127,11 +150,11 @@ def process_transcription_job(job_id):
                     'transcript': transcript[:500] + '...' if len(transcript) > 500 else transcript
                 }
 
-                if job.export_timestamps and transcriber.last_transcript:
+                if job.export_timestamps and job_transcriber.last_transcript:
                     try:
-                        saved_files = transcriber.save_transcript_data(
+                        saved_files = job_transcriber.save_transcript_data(
                             file_path,
-                            transcriber.last_transcript,
+                            job_transcriber.last_transcript,
                             same_as_input=job.same_as_input
                         )
 
@@ -168,8 +191,12 @@ def process_transcription_job(job_id):
         job.end_time = datetime.now()
     
     finally:
-        # Clean up all temporary files
-        audio_handler.cleanup_all_temp_files()
+        # Clean up this job's temporary files; already-removed ones are skipped
+        for temp_path in job_temp_files:
+            audio_handler.cleanup_temp_file(temp_path)
+
+# Run jobs through a bounded queue so in-flight work stays limited
+job_queue = TranscriptionQueue(process_transcription_job, max_concurrent=config.max_concurrent_jobs)
 
 @app.route('/')
 def index():
@@ -238,10 +265,12 @@ def upload_files():
     job = TranscriptionJob(job_id, uploaded_files, output_directory, same_as_input, export_timestamps)
     jobs[job_id] = job
     
-    # Start processing in background
-    thread = threading.Thread(target=process_transcription_job, args=(job_id,))
-    thread.daemon = True
-    thread.start()
+    # Queue for background processing
+    try:
+        job_queue.submit(job_id)
+    except RecallError:
+        del jobs[job_id]
+        raise
     
     return jsonify({
         'job_id': job_id,
@@ -274,13 +303,13 @@ def api_config():
     
     elif request.method == 'POST':
         data = request.get_json()
-        if 'api_key' in data:
+        if 'api_key' in data and data['api_key'] != config.api_key:
             config.api_key = data['api_key']
             # Save to config file
-            config_path = os.path.expanduser('~/.recall/config.json')
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            with open(config_path, 'w') as f:
-                json.dump({'api_key': config.api_key}, f)
+            config.save_api_key_to_config(config.api_key)
+            
+            # Drop cached clients so new jobs use the new key
+            Transcriber.invalidate()
         
         return jsonify({'success': True})
 
@@ -313,11 +342,16 @@ def download_results(job_id):
                         zf.write(result['srt_path'], os.path.basename(result['srt_path']))
 
                 except Exception as e:
-                    print(f"Error adding file to zip: {e}")
+                    logging.warning(f"Error adding file to zip: {e}")
 
     memory_file.seek(0)
     
-    return send_file(memory_file, download_name=f'recall_transcripts_{job_id}.zip', as_attachment=True)
+    return send_file(
+        memory_file,
+        mimetype='application/zip',  # Known type; skips the mimetypes lookup on download_name
+        download_name=f'recall_transcripts_{job_id}.zip',
+        as_attachment=True
+    )
 
 @app.after_request
 def add_header(response):
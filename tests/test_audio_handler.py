@@ -269,4 +269,29 @@ class TestAudioHandler:
                 assert True  # If we get here, no memory errors occurred
         except AttributeError:
             # Method might not exist
-            pass 
\ No newline at end of file
+            pass
+    
+    def test_format_file_size(self):
+        """Test human-readable file size formatting"""
+        assert AudioHandler.format_file_size(0) == "0 B"
+        assert AudioHandler.format_file_size(1023) == "1023 B"
+        assert AudioHandler.format_file_size(1024) == "1.0 KB"
+        assert AudioHandler.format_file_size(1536) == "1.5 KB"
+        assert AudioHandler.format_file_size(5 * 1024 * 1024) == "5.0 MB"
+        assert AudioHandler.format_file_size(3 * 1024 ** 3) == "3.0 GB"
+        assert AudioHandler.format_file_size(2 * 1024 ** 5) == "2048.0 TB"
+    
+    def test_get_audio_files_recurses_directories(self):
+        """Test that directory scans find supported files in subdirectories"""
+        nested_dir = os.path.join(self.temp_dir, 'nested', 'deeper')
+        os.makedirs(nested_dir)
+        for directory, name in ((nested_dir, 'clip.MP4'), (nested_dir, 'notes.txt')):
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(b'data')
+        
+        found = self.audio_handler.get_audio_files(self.temp_dir)
+        
+        expected = {os.path.join(self.temp_dir, name) for name in self.test_files}
+        expected.add(os.path.join(nested_dir, 'clip.MP4'))
+        assert set(found) == expected
+        assert len(found) == len(expected)
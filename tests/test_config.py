@@ -7,6 +7,8 @@ import pytest
 import os
 import tempfile
 import shutil
+import json
+import stat
 from unittest.mock import patch, MagicMock
 import sys
 
@@ -58,6 +60,33 @@ class TestConfig:
         config = Config()
         assert config.output_dir == 'custom_output_path'
     
+    @patch.dict(os.environ, {'LOG_LEVEL': 'debug'})
+    def test_log_level_from_environment(self):
+        """Test that LOG_LEVEL is read case-insensitively"""
+        config = Config()
+        assert config.log_level == 'DEBUG'
+    
+    @patch.dict(os.environ, {'LOG_LEVEL': 'verbose'})
+    def test_unknown_log_level_falls_back_to_info(self):
+        """Test that an unrecognized LOG_LEVEL doesn't break logging setup"""
+        config = Config()
+        assert config.log_level == 'INFO'
+    
+    @patch.dict(os.environ, {'ASSEMBLYAI_MAX_CONCURRENCY': '8'})
+    def test_max_concurrency_from_environment(self):
+        """Test that ASSEMBLYAI_MAX_CONCURRENCY is read as an integer"""
+        assert Config().assemblyai_max_concurrency == 8
+    
+    @patch.dict(os.environ, {'ASSEMBLYAI_MAX_CONCURRENCY': 'four'})
+    def test_invalid_max_concurrency_falls_back_to_default(self):
+        """Test that a malformed ASSEMBLYAI_MAX_CONCURRENCY doesn't crash Config()"""
+        assert Config().assemblyai_max_concurrency == 4
+    
+    @patch.dict(os.environ, {'MAX_CONCURRENT_JOBS': ''})
+    def test_invalid_max_concurrent_jobs_falls_back_to_default(self):
+        """Test that a malformed MAX_CONCURRENT_JOBS doesn't crash Config()"""
+        assert Config().max_concurrent_jobs == 4
+    
     @patch.dict(os.environ, {}, clear=True)
     def test_default_values(self):
         """Test default values when no environment variables are set"""
@@ -171,4 +200,86 @@ class TestConfig:
         
         # If config attempts to create directories, it should work
         # This is a basic test for directory handling
-        assert config.output_dir is not None 
\ No newline at end of file
+        assert config.output_dir is not None
+    
+    def test_is_supported_format(self):
+        """Test extension matching for audio and video files"""
+        config = Config()
+        
+        assert config.is_supported_format('recording.wav')
+        assert config.is_supported_format('RECORDING.MP3')
+        assert config.is_supported_format('/some/dir/clip.mp4')
+        assert config.is_supported_format('archive.tar.flac')
+        
+        assert not config.is_supported_format('notes.txt')
+        assert not config.is_supported_format('wav')
+        assert not config.is_supported_format('recording.wav.bak')
+        assert not config.is_supported_format('/some/dir/.mp3')
+    
+    def test_is_video_format(self):
+        """Test that video detection only matches video extensions"""
+        config = Config()
+        
+        assert config.is_video_format('clip.mp4')
+        assert config.is_video_format('/some/dir/CLIP.MKV')
+        
+        assert not config.is_video_format('recording.wav')
+        assert not config.is_video_format('notes.txt')
+    
+    def test_save_api_key_to_config(self):
+        """Test that saving the API key preserves other settings and leaves no temp file"""
+        config_dir = os.path.join(self.temp_dir, '.recall')
+        os.makedirs(config_dir)
+        config_file = os.path.join(config_dir, 'config.json')
+        with open(config_file, 'w') as f:
+            json.dump({'api_key': 'old_key', 'theme': 'dark'}, f)
+        
+        with patch('os.path.expanduser', return_value=config_dir):
+            config = Config()
+            config.save_api_key_to_config('new_key')
+            assert config.load_api_key_from_config() == 'new_key'
+        
+        with open(config_file) as f:
+            assert json.load(f) == {'api_key': 'new_key', 'theme': 'dark'}
+        assert not os.path.exists(config_file + '.tmp')
+    
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+    def test_save_api_key_keeps_file_permissions(self):
+        """Test that saving the API key doesn't widen the config file's permissions"""
+        config_dir = os.path.join(self.temp_dir, '.recall')
+        os.makedirs(config_dir)
+        config_file = os.path.join(config_dir, 'config.json')
+        with open(config_file, 'w') as f:
+            json.dump({'api_key': 'old_key'}, f)
+        os.chmod(config_file, 0o600)
+        
+        with patch('os.path.expanduser', return_value=config_dir):
+            Config().save_api_key_to_config('new_key')
+        assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o600
+        
+        # A config file created by the save is owner-only too
+        os.remove(config_file)
+        with patch('os.path.expanduser', return_value=config_dir):
+            Config().save_api_key_to_config('another_key')
+        assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o600
+    
+    def test_load_api_key_from_config_cached_by_mtime(self):
+        """Test that the config file is only re-read when it changes on disk"""
+        config_dir = os.path.join(self.temp_dir, '.recall')
+        os.makedirs(config_dir)
+        config_file = os.path.join(config_dir, 'config.json')
+        with open(config_file, 'w') as f:
+            json.dump({'api_key': 'first_key'}, f)
+        
+        with patch('os.path.expanduser', return_value=config_dir):
+            config = Config()
+            assert config.load_api_key_from_config() == 'first_key'
+            
+            with patch('builtins.open', side_effect=AssertionError("config re-read")):
+                assert config.load_api_key_from_config() == 'first_key'
+            
+            with open(config_file, 'w') as f:
+                json.dump({'api_key': 'second_key'}, f)
+            stat = os.stat(config_file)
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert config.load_api_key_from_config() == 'second_key'
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the file writing helpers
+"""
+
+import pytest
+import os
+import tempfile
+import shutil
+import sys
+from unittest.mock import patch
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.utils.files import write_text_file
+
+
+class TestWriteTextFile:
+    """Test suite for write_text_file"""
+
+    def setup_method(self):
+        """Set up test environment before each test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'transcript.txt')
+
+    def teardown_method(self):
+        """Clean up after each test"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_writes_utf8_text(self):
+        """Test that text is written as UTF-8 without newline translation"""
+        text = "Speaker A: héllo → wörld\nSpeaker B: 你好\n"
+        write_text_file(self.path, text)
+        
+        with open(self.path, 'rb') as f:
+            assert f.read() == text.encode('utf-8')
+
+    def test_truncates_existing_file(self):
+        """Test that a shorter write replaces a longer existing file"""
+        write_text_file(self.path, "a much longer first transcript")
+        write_text_file(self.path, "short")
+        
+        with open(self.path, encoding='utf-8') as f:
+            assert f.read() == "short"
+
+    def test_fsync_flushes_before_close(self):
+        """Test that fsync=True syncs the file descriptor it wrote"""
+        with patch('src.utils.files.os.fsync') as mock_fsync:
+            write_text_file(self.path, "synced", fsync=True)
+        
+        mock_fsync.assert_called_once()
+        with open(self.path, encoding='utf-8') as f:
+            assert f.read() == "synced"
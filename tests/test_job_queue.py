@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the TranscriptionQueue class
+"""
+
+import pytest
+import os
+import threading
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.job_queue import TranscriptionQueue
+from src.core.errors import RecallError
+
+
+class TestTranscriptionQueue:
+    """Test suite for TranscriptionQueue class"""
+
+    def setup_method(self):
+        """Set up test environment before each test"""
+        self.processed = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        
+    def blocking_handler(self, job_id):
+        """Handler that holds the first job until released"""
+        if job_id == 'first':
+            self.started.set()
+            self.release.wait(5)
+        self.processed.append(job_id)
+    
+    def test_jobs_are_processed(self):
+        """Test that submitted jobs are handed to the handler"""
+        job_queue = TranscriptionQueue(self.processed.append, max_concurrent=2)
+        
+        for i in range(5):
+            job_queue.submit(f"job-{i}")
+        job_queue.join()
+        
+        assert sorted(self.processed) == [f"job-{i}" for i in range(5)]
+    
+    def test_priority_then_fifo_order(self):
+        """Test that waiting jobs run by priority, then submission order"""
+        job_queue = TranscriptionQueue(self.blocking_handler, max_concurrent=1)
+        
+        job_queue.submit('first')
+        job_queue.submit('low-1', priority=5)
+        job_queue.submit('high', priority=0)
+        job_queue.submit('low-2', priority=5)
+        self.release.set()
+        job_queue.join()
+        
+        assert self.processed == ['first', 'high', 'low-1', 'low-2']
+    
+    def test_handler_errors_do_not_stop_workers(self):
+        """Test that a failing job does not kill the worker thread"""
+        def handler(job_id):
+            if job_id == 'bad':
+                raise ValueError("boom")
+            self.processed.append(job_id)
+        
+        job_queue = TranscriptionQueue(handler, max_concurrent=1)
+        job_queue.submit('bad')
+        job_queue.submit('good')
+        job_queue.join()
+        
+        assert self.processed == ['good']
+    
+    def test_full_queue_raises(self):
+        """Test that submitting past capacity raises RecallError"""
+        job_queue = TranscriptionQueue(self.blocking_handler, max_concurrent=1, maxsize=1)
+        
+        job_queue.submit('first')
+        # Wait until the worker has taken 'first' so the queue slot is free again
+        assert self.started.wait(5)
+        job_queue.submit('queued')
+        
+        with pytest.raises(RecallError):
+            job_queue.submit('overflow')
+        
+        self.release.set()
+        job_queue.join()
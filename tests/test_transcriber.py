@@ -7,15 +7,18 @@ import pytest
 import os
 import tempfile
 import shutil
-from unittest.mock import patch, MagicMock, Mock
+import time
+import threading
+from unittest.mock import patch, MagicMock, Mock, call
 import sys
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.core.transcriber import Transcriber
+from src.core.transcriber import Transcriber, RateLimiter
 from src.utils.config import Config
+from src.core.errors import TranscriptionCancelledError
 
 
 class TestTranscriber:
@@ -361,4 +364,91 @@ class TestTranscriber:
                 assert result is None or isinstance(result, str)
             except Exception as e:
                 # If method doesn't exist, that's expected
-                assert "has no attribute" in str(e) or "transcribe_file" in str(e) 
\ No newline at end of file
+                assert "has no attribute" in str(e) or "transcribe_file" in str(e)
+    
+    def test_map_speaker_label(self):
+        """Test speaker label formatting and caching"""
+        assert self.transcriber.map_speaker_label('A') == 'Speaker A'
+        assert self.transcriber.map_speaker_label('AA') == 'Speaker AA'
+        assert self.transcriber.map_speaker_label(3) == 'Speaker 3'
+        
+        # Repeated lookups return the cached string
+        assert self.transcriber.map_speaker_label('AA') is self.transcriber.map_speaker_label('AA')
+    
+    def test_rate_limiter_allows_burst_up_to_capacity(self):
+        """Test that the rate limiter hands out its full bucket without blocking"""
+        limiter = RateLimiter(max_rate=5, time_period=60)
+        
+        with patch('src.core.transcriber.time.sleep') as mock_sleep:
+            for _ in range(5):
+                with limiter:
+                    pass
+            mock_sleep.assert_not_called()
+    
+    def test_rate_limiter_waits_when_exhausted(self):
+        """Test that the rate limiter sleeps once the bucket is empty"""
+        limiter = RateLimiter(max_rate=1, time_period=0.05)
+        limiter.acquire()
+        
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.03
+    
+    def test_client_shared_per_api_key(self):
+        """Test that transcribers with the same API key reuse one AssemblyAI client"""
+        other = Transcriber(self.config)
+        assert other.transcriber is self.transcriber.transcriber
+        
+        Transcriber.invalidate()
+        refreshed = Transcriber(self.config)
+        assert refreshed.transcriber is not self.transcriber.transcriber
+    
+    def test_transcribe_file_cancelled_before_submit(self):
+        """Test that a set cancel event stops the transcription before anything is uploaded"""
+        self.transcriber.transcriber = MagicMock()
+        cancel_event = threading.Event()
+        cancel_event.set()
+        
+        with pytest.raises(TranscriptionCancelledError):
+            self.transcriber.transcribe_file(self.test_audio_file, cancel_event=cancel_event)
+        self.transcriber.transcriber.submit.assert_not_called()
+    
+    def test_transcribe_file_cancelled_while_polling(self):
+        """Test that cancelling during polling abandons the queued transcript"""
+        import assemblyai as aai
+        queued = MagicMock(status=aai.TranscriptStatus.queued, id='abc')
+        self.transcriber.transcriber = MagicMock()
+        self.transcriber.transcriber.submit.return_value = queued
+        cancel_event = MagicMock()
+        cancel_event.is_set.return_value = False
+        cancel_event.wait.return_value = True
+        
+        with patch('assemblyai.Transcript.get_by_id') as mock_get:
+            with pytest.raises(TranscriptionCancelledError):
+                self.transcriber.transcribe_file(self.test_audio_file, cancel_event=cancel_event)
+            mock_get.assert_not_called()
+        self.transcriber.transcriber.submit.assert_called_once()
+    
+    def test_request_slots_shared_across_transcribers(self):
+        """Test that every transcriber draws from one process-wide request semaphore"""
+        other = Transcriber(self.config)
+        assert other._request_slots is self.transcriber._request_slots
+    
+    def test_rate_limiter_paces_each_poll(self):
+        """Test that submit and every status poll take a rate limiter token"""
+        import assemblyai as aai
+        queued = MagicMock(status=aai.TranscriptStatus.queued, id='abc')
+        completed = MagicMock(status=aai.TranscriptStatus.completed, id='abc')
+        self.transcriber.transcriber = MagicMock()
+        self.transcriber.transcriber.submit.return_value = queued
+        cancel_event = MagicMock()
+        cancel_event.is_set.return_value = False
+        cancel_event.wait.return_value = False
+        
+        with patch('assemblyai.Transcript.get_by_id', side_effect=[queued, completed]), \
+             patch('src.core.transcriber._ASSEMBLYAI_LIMITER') as mock_limiter:
+            transcript = self.transcriber._transcribe_cancellable(self.test_audio_file, cancel_event)
+        
+        assert transcript is completed
+        # Upload and submit, then one token per poll
+        assert mock_limiter.acquire.call_args_list == [call(2), call(), call()]
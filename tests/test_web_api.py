@@ -317,11 +317,11 @@ class TestWebAPI:
         for response in responses:
             assert response.status_code in [200, 429]  # OK or Too Many Requests
     
-    @patch('src.web.api.transcriber')
-    def test_transcription_integration(self, mock_transcriber):
+    @patch('src.web.api.Transcriber')
+    def test_transcription_integration(self, mock_transcriber_class):
         """Test transcription integration"""
         # Mock transcriber
-        mock_transcriber.transcribe_file.return_value = "Test transcription result"
+        mock_transcriber_class.return_value.transcribe_file.return_value = "Test transcription result"
         
         # Test file upload with transcription
         with open(self.test_audio_file, 'rb') as f:
@@ -358,4 +358,50 @@ class TestWebAPI:
         # Test if version info is included
         data = json.loads(response.data)
         # Version info is optional
-        assert 'version' in data or 'status' in data 
\ No newline at end of file
+        assert 'version' in data or 'status' in data
+    
+    def test_job_progress_adapter(self):
+        """Test that per-file progress is mapped onto overall job progress"""
+        from src.web.api import _JobProgressAdapter
+        from src.core.jobs import TranscriptionJob
+        
+        job = TranscriptionJob('job-id', ['a.wav', 'b.wav'], self.temp_dir)
+        adapter = _JobProgressAdapter(job, total_files=2)
+        
+        adapter("Transcribing a.wav", 50, "transcribing")
+        assert job.progress == 25
+        
+        adapter.file_index = 1
+        adapter("Completed b.wav", 100, "completed", {})
+        assert job.progress == 100
+        
+        # Error callbacks leave progress untouched
+        adapter("Failed", -1, "error")
+        assert job.progress == 100
+    
+    def test_job_update_progress_clamps(self):
+        """Test that job progress stays within 0-100"""
+        from src.core.jobs import TranscriptionJob
+        
+        job = TranscriptionJob('job-id', ['a.wav'], self.temp_dir)
+        job.update_progress(42.5)
+        assert job.progress == 42.5
+        
+        job.update_progress(100.0000001)
+        assert job.progress == 100
+        
+        job.update_progress(-3)
+        assert job.progress == 0
+    
+    def test_config_post_unchanged_key_is_noop(self):
+        """Test that re-posting the current API key doesn't rewrite config or drop cached clients"""
+        import src.web.api as api
+        
+        with patch.object(api.config, 'api_key', 'same_key'), \
+             patch.object(api.config, 'save_api_key_to_config') as mock_save, \
+             patch.object(api.Transcriber, 'invalidate') as mock_invalidate:
+            response = self.app.post('/api/config', json={'api_key': 'same_key'})
+            
+            assert response.status_code == 200
+            mock_save.assert_not_called()
+            mock_invalidate.assert_not_called()